@@ -20,6 +20,10 @@ from climateeconomics.sos_wrapping.sos_wrapping_sectors.subsector_model import (
     SubSectorModel,
 )
 
+# output keys used several times per compute, formatted once
+BIOMASS_DRY_PRODUCTION = f'{GlossaryCore.Forestry}.techno_production:{GlossaryCore.biomass_dry}'
+CO2_EMISSIONS_PRODUCTION = f'{GlossaryCore.Forestry}.CO2_emissions:production'
+
 
 class ForestryModel(SubSectorModel):
     """Forestry model class"""
@@ -46,10 +50,11 @@ class ForestryModel(SubSectorModel):
         self.compute_production_for_energy()
         self.compute_biomass_dry_price_in_d_per_t()
         self.compute_carbon_emissions()
-        self.compute_carbon_consumption()
 
         self.compute_economical_output_and_damages()
-        self.rescale_techno_production_and_consumption()
+        self.rescale_techno_production()
+        # carbon consumption is derived from the rescaled production, so it must follow the rescale
+        self.compute_carbon_consumption()
         self.compute_coupling_dfs()
         self.compute_forestry_capital()
 
@@ -109,12 +114,11 @@ class ForestryModel(SubSectorModel):
                                                                   self.outputs['managed_wood_df:residues_production (Mt)']
 
         # CO2 part
-        self.outputs['managed_wood_df:delta_CO2_emitted'] = - \
-                                                        self.outputs['managed_wood_df:delta_surface'] * self.inputs['params']['CO2_per_ha'] / 1000
+        co2_per_ha = self.inputs['params']['CO2_per_ha'] / 1000
+        self.outputs['managed_wood_df:delta_CO2_emitted'] = - self.outputs['managed_wood_df:delta_surface'] * co2_per_ha
         # CO2 emitted is delta cumulate
-        self.outputs['managed_wood_df:CO2_emitted'] = - \
-                                                  (self.outputs['managed_wood_df:cumulative_surface'] -
-                                                   self.inputs['managed_wood_initial_surface']) * self.inputs['params']['CO2_per_ha'] / 1000
+        self.outputs['managed_wood_df:CO2_emitted'] = - (self.outputs['managed_wood_df:cumulative_surface'] -
+                                                         self.inputs['managed_wood_initial_surface']) * co2_per_ha
 
     def compute_reforestation_deforestation_surface(self):
         """
@@ -134,8 +138,11 @@ class ForestryModel(SubSectorModel):
         self.outputs['forest_surface_detail_df:deforestation_surface'] = self.np.cumsum(self.outputs['forest_surface_detail_df:delta_deforestation_surface'])
         self.outputs['forest_surface_detail_df:reforestation_surface'] = self.np.cumsum(self.outputs['forest_surface_detail_df:delta_reforestation_surface'])
 
-        delta_unmanaged_forest_surface = self.outputs['forest_surface_detail_df:delta_reforestation_surface'] + self.outputs['forest_surface_detail_df:delta_deforestation_surface']
-        self.outputs['forest_surface_detail_df:unmanaged_forest'] = self.np.maximum(self.inputs['initial_unmanaged_forest_surface'] + self.np.cumsum(delta_unmanaged_forest_surface), 0)
+        # reforestation + deforestation deltas, reused as the global forest surface delta
+        self.temp_variables['forest_surface:delta_unmanaged_forest_surface'] = self.outputs['forest_surface_detail_df:delta_reforestation_surface'] + self.outputs['forest_surface_detail_df:delta_deforestation_surface']
+        # cumsum is linear: the cumulated unmanaged delta is the sum of both cumulated surfaces, reused as forest constraint evolution
+        self.temp_variables['forest_surface:cumulated_unmanaged_forest_surface'] = self.outputs['forest_surface_detail_df:reforestation_surface'] + self.outputs['forest_surface_detail_df:deforestation_surface']
+        self.outputs['forest_surface_detail_df:unmanaged_forest'] = self.np.maximum(self.inputs['initial_unmanaged_forest_surface'] + self.temp_variables['forest_surface:cumulated_unmanaged_forest_surface'], 0)
 
     def compute_deforestation_biomass(self):
         """
@@ -160,8 +167,7 @@ class ForestryModel(SubSectorModel):
         """
         managed wood and unmanaged wood impact forest_surface_detail_df
         """
-        self.outputs['forest_surface_detail_df:delta_global_forest_surface'] = self.outputs['forest_surface_detail_df:delta_reforestation_surface'] + \
-                                                                        self.outputs['forest_surface_detail_df:delta_deforestation_surface']
+        self.outputs['forest_surface_detail_df:delta_global_forest_surface'] = self.temp_variables['forest_surface:delta_unmanaged_forest_surface']
         self.outputs['forest_surface_detail_df:global_forest_surface'] = self.outputs['managed_wood_df:cumulative_surface'] + \
                                                                   self.outputs['forest_surface_detail_df:unmanaged_forest'] + \
                                                                   self.inputs['initial_protected_forest_surface']
@@ -172,20 +178,16 @@ class ForestryModel(SubSectorModel):
         compute the global CO2 production in Gt
         """
         # in Gt of CO2
+        co2_per_ha = self.inputs['params']['CO2_per_ha'] / 1000
 
-        self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:delta_CO2_emitted'] = -self.outputs['forest_surface_detail_df:delta_global_forest_surface'] * \
-                                                           self.inputs['params']['CO2_per_ha'] / 1000
-        self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:delta_CO2_deforestation'] = -self.outputs['forest_surface_detail_df:delta_deforestation_surface'] * \
-                                                                 self.inputs['params']['CO2_per_ha'] / 1000
-        self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:delta_CO2_reforestation'] = -self.outputs['forest_surface_detail_df:delta_reforestation_surface'] * \
-                                                                 self.inputs['params']['CO2_per_ha'] / 1000
+        self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:delta_CO2_emitted'] = -self.outputs['forest_surface_detail_df:delta_global_forest_surface'] * co2_per_ha
+        self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:delta_CO2_deforestation'] = -self.outputs['forest_surface_detail_df:delta_deforestation_surface'] * co2_per_ha
+        self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:delta_CO2_reforestation'] = -self.outputs['forest_surface_detail_df:delta_reforestation_surface'] * co2_per_ha
 
         # remove CO2 managed surface from global emission because CO2_per_ha
         # from managed forest = 0
-        self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:CO2_deforestation'] = - self.outputs['forest_surface_detail_df:deforestation_surface'] * \
-                                                           self.inputs['params']['CO2_per_ha'] / 1000
-        self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:CO2_reforestation'] = -self.outputs['forest_surface_detail_df:reforestation_surface'] * \
-                                                           self.inputs['params']['CO2_per_ha'] / 1000
+        self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:CO2_deforestation'] = - self.outputs['forest_surface_detail_df:deforestation_surface'] * co2_per_ha
+        self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:CO2_reforestation'] = -self.outputs['forest_surface_detail_df:reforestation_surface'] * co2_per_ha
         self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:initial_CO2_land_use_change'] = self.zeros_array + self.inputs['initial_co2_emissions']
         # global sum up
         self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:global_CO2_emitted'] = self.outputs[f'{GlossaryCore.CO2EmissionsDetailDfValue}:CO2_deforestation'] + \
@@ -262,15 +264,15 @@ class ForestryModel(SubSectorModel):
         '''
         # CO2 emissions
         if 'CO2_from_production' not in self.inputs['params']:
-            self.outputs[f'{GlossaryCore.Forestry}.CO2_emissions:production'] = self.zeros_array + self.get_theoretical_co2_prod(unit='kg/kWh')
+            self.outputs[CO2_EMISSIONS_PRODUCTION] = self.zeros_array + self.get_theoretical_co2_prod(unit='kg/kWh')
         elif self.inputs['params']['CO2_from_production'] == 0.0:
-            self.outputs[f'{GlossaryCore.Forestry}.CO2_emissions:production'] = self.zeros_array + 0.0
+            self.outputs[CO2_EMISSIONS_PRODUCTION] = self.zeros_array + 0.0
         else:
             if self.inputs['params']['CO2_from_production_unit'] == 'kg/kg':
-                self.outputs[f'{GlossaryCore.Forestry}.CO2_emissions:production'] = self.zeros_array + self.inputs['params']['CO2_from_production'] / \
-                                                           self.inputs['params']['biomass_dry_high_calorific_value']
+                self.outputs[CO2_EMISSIONS_PRODUCTION] = self.zeros_array + self.inputs['params']['CO2_from_production'] / \
+                                                         self.inputs['params']['biomass_dry_high_calorific_value']
             elif self.inputs['params']['CO2_from_production_unit'] == 'kg/kWh':
-                self.outputs[f'{GlossaryCore.Forestry}.CO2_emissions:production'] = self.zeros_array + self.inputs['params']['CO2_from_production']
+                self.outputs[CO2_EMISSIONS_PRODUCTION] = self.zeros_array + self.inputs['params']['CO2_from_production']
 
         # Add carbon emission from input energies (resources or other
         # energies)
@@ -278,8 +280,8 @@ class ForestryModel(SubSectorModel):
         co2_emissions_frominput_energies = self.compute_CO2_emissions_from_input_resources()
 
         # Add CO2 from production + C02 from input energies
-        self.outputs[f'{GlossaryCore.Forestry}.CO2_emissions:{GlossaryCore.Forestry}'] = self.outputs[f'{GlossaryCore.Forestry}.CO2_emissions:production'] + \
-                                               co2_emissions_frominput_energies
+        self.outputs[f'{GlossaryCore.Forestry}.CO2_emissions:{GlossaryCore.Forestry}'] = self.outputs[CO2_EMISSIONS_PRODUCTION] + \
+                                                                                         co2_emissions_frominput_energies
 
     def get_theoretical_co2_prod(self, unit='kg/kWh'):
         '''
@@ -295,23 +297,19 @@ class ForestryModel(SubSectorModel):
 
     def compute_production_for_energy(self):
         # techno production in TWh
-        self.outputs[f'{GlossaryCore.Forestry}.techno_production:{GlossaryCore.biomass_dry}'] = (self.outputs['managed_wood_df:wood_production_for_energy (Mt)'] +
-                                                                                    self.outputs['biomass_dry_detail_df:deforestation_for_energy']) * self.inputs['params']['biomass_dry_calorific_value'] + self.outputs['managed_wood_df:residues_production_for_energy (Mt)'] * self.inputs['params']['residue_calorific_value']
+        self.outputs[BIOMASS_DRY_PRODUCTION] = (self.outputs['managed_wood_df:wood_production_for_energy (Mt)'] +
+                                                self.outputs['biomass_dry_detail_df:deforestation_for_energy']) * self.inputs['params']['biomass_dry_calorific_value'] + self.outputs['managed_wood_df:residues_production_for_energy (Mt)'] * self.inputs['params']['residue_calorific_value']
 
     def compute_carbon_consumption(self):
-        # CO2 consumed
-        self.outputs[f'techno_consumption:{GlossaryEnergy.carbon_captured} (Mt)'] = \
-            -self.inputs['params']['CO2_from_production'] / self.inputs['params']['biomass_dry_high_calorific_value'] * \
-            self.outputs[f'{GlossaryCore.Forestry}.techno_production:{GlossaryCore.biomass_dry}']
-
-        self.outputs[f'techno_consumption_woratio:{GlossaryEnergy.carbon_captured} (Mt)'] = \
-            - self.inputs['params']['CO2_from_production'] / self.inputs['params']['biomass_dry_high_calorific_value'] * \
-            self.outputs[f'{GlossaryCore.Forestry}.techno_production:{GlossaryCore.biomass_dry}']
+        # CO2 consumed, same with and without ratio
+        carbon_consumption = -self.inputs['params']['CO2_from_production'] / self.inputs['params']['biomass_dry_high_calorific_value'] * \
+            self.outputs[BIOMASS_DRY_PRODUCTION]
+        self.outputs[f'techno_consumption:{GlossaryEnergy.carbon_captured} (Mt)'] = carbon_consumption
+        self.outputs[f'techno_consumption_woratio:{GlossaryEnergy.carbon_captured} (Mt)'] = carbon_consumption
 
     def compute_forest_constraint_evolution(self):
         # compute forest constrain evolution: reforestation + deforestation
-        self.outputs['forest_surface_detail_df:forest_constraint_evolution'] = self.outputs['forest_surface_detail_df:reforestation_surface'] + \
-                                                                        self.outputs['forest_surface_detail_df:deforestation_surface']
+        self.outputs['forest_surface_detail_df:forest_constraint_evolution'] = self.temp_variables['forest_surface:cumulated_unmanaged_forest_surface']
 
     def compute_biomass_dry_price_in_d_per_t(self):
         # for sectorized version :
@@ -364,9 +362,11 @@ class ForestryModel(SubSectorModel):
     def compute_yields(self):
         """yields are impact by climate change"""
         self.outputs[f'yields:{GlossaryCore.Years}'] = self.years
-        self.outputs['yields:actual'] = self.inputs['params']['actual_yield_year_start'] * (1 + self.inputs[f'{GlossaryCore.CropProductivityReductionName}:{GlossaryCore.CropProductivityReductionName}'] / 100)
-        self.outputs['yields:managed wood'] = self.inputs['params']['managed_wood_yield_year_start'] * (1 + self.inputs[f'{GlossaryCore.CropProductivityReductionName}:{GlossaryCore.CropProductivityReductionName}'] / 100)
-        self.outputs['yields:unmanaged wood'] = self.inputs['params']['unmanaged_wood_yield_year_start'] * (1 + self.inputs[f'{GlossaryCore.CropProductivityReductionName}:{GlossaryCore.CropProductivityReductionName}'] / 100)
+        # same climate change factor for all yields
+        yield_factor = 1 + self.inputs[f'{GlossaryCore.CropProductivityReductionName}:{GlossaryCore.CropProductivityReductionName}'] / 100
+        self.outputs['yields:actual'] = self.inputs['params']['actual_yield_year_start'] * yield_factor
+        self.outputs['yields:managed wood'] = self.inputs['params']['managed_wood_yield_year_start'] * yield_factor
+        self.outputs['yields:unmanaged wood'] = self.inputs['params']['unmanaged_wood_yield_year_start'] * yield_factor
 
     def initialize_years(self):
         self.years = self.np.arange(self.inputs[GlossaryCore.YearStart], self.inputs[GlossaryCore.YearEnd] + 1)
@@ -389,10 +389,9 @@ class ForestryModel(SubSectorModel):
         self.outputs[f'{GlossaryCore.Forestry}.land_use_required:{GlossaryCore.Years}'] = self.years
         self.outputs[f'{GlossaryCore.Forestry}.land_use_required:{GlossaryCore.Forestry} (Gha)'] = self.outputs['managed_wood_df:cumulative_surface']
 
-    def rescale_techno_production_and_consumption(self):
-        self.outputs[f'{GlossaryCore.Forestry}.techno_production:{GlossaryCore.biomass_dry}'] = self.outputs[f'{GlossaryCore.Forestry}.techno_production:{GlossaryCore.biomass_dry}'] /1e3
-        self.outputs[f'techno_consumption:{GlossaryEnergy.carbon_captured} (Mt)'] = self.outputs[f'techno_consumption:{GlossaryEnergy.carbon_captured} (Mt)'] / 1e3
-        self.outputs[f'techno_consumption_woratio:{GlossaryEnergy.carbon_captured} (Mt)'] = self.outputs[f'techno_consumption_woratio:{GlossaryEnergy.carbon_captured} (Mt)'] / 1e3
+    def rescale_techno_production(self):
+        """rescale the biomass dry production"""
+        self.outputs[BIOMASS_DRY_PRODUCTION] = self.outputs[BIOMASS_DRY_PRODUCTION] /1e3
 
     def compute_coupling_dfs(self):
         self.outputs[f'biomass_dry_df:{GlossaryCore.Years}'] = self.years
@@ -0,0 +1,29 @@
+'''
+Copyright 2024 Capgemini
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import numpy as np
+import pandas as pd
+
+from climateeconomics.glossarycore import GlossaryCore
+
+
+def sections_df(years, csv_path):
+    ''' spread the first row of a sections csv over the years range, as a single float block
+    '''
+    sections = pd.read_csv(csv_path)
+    block = np.tile(sections.to_numpy()[0, 1:], (len(years), 1))
+    df = pd.DataFrame(block, columns=sections.columns[1:], copy=False)
+    df.insert(0, GlossaryCore.Years, years)
+    return df
@@ -41,7 +41,7 @@ class Study(StudyManager):
 
         crop_productivity_reduction = pd.DataFrame({
             GlossaryCore.Years: years,
-            GlossaryCore.CropProductivityReductionName: np.linspace(0., 4.5, len(years)) * 0,  # fake
+            GlossaryCore.CropProductivityReductionName: np.zeros(year_range),  # fake
         })
 
         damage_fraction = pd.DataFrame({
@@ -53,14 +53,15 @@ class Study(StudyManager):
         true_invests_agri_df = true_invests_agri_df.loc[true_invests_agri_df[GlossaryCore.Years] >= self.year_start]
         last_year_invest = true_invests_agri_df[GlossaryCore.Years].max()
         n_missing_years = self.year_end - last_year_invest
-        invest_agri = np.array(list(true_invests_agri_df['investment']) + [true_invests_agri_df['investment'].values[-1]] * n_missing_years)
-
-        investments = pd.DataFrame({
-            GlossaryCore.Years: years,
-            **{food_type: invest_agri *
-                          GlossaryCore.crop_calibration_data['invest_food_type_share_start'][food_type] / 100. * 1000.
-               for food_type in GlossaryCore.DefaultFoodTypesV2}  # convert to G$
-        })
+        invest_agri = true_invests_agri_df['investment'].to_numpy()
+        invest_agri = np.concatenate([invest_agri, np.full(n_missing_years, invest_agri[-1])])
+
+        invest_shares = np.array([GlossaryCore.crop_calibration_data['invest_food_type_share_start'][food_type]
+                                  for food_type in GlossaryCore.DefaultFoodTypesV2])
+        # all food types invests in a single product, % -> share and convert to G$
+        invests_food_types = np.outer(invest_agri, invest_shares) / 100. * 1000.
+        investments = pd.DataFrame(invests_food_types, columns=GlossaryCore.DefaultFoodTypesV2, copy=False)
+        investments.insert(0, GlossaryCore.Years, years)
         workforce_df = pd.DataFrame({
             GlossaryCore.Years: years,
             GlossaryCore.SectorAgriculture: np.linspace(935., 935*50, year_range)  # millions of people (2020 value)
@@ -83,18 +84,19 @@ class Study(StudyManager):
         })
         share_investments_between_agri_subsectors = pd.DataFrame({
             GlossaryCore.Years: years,
-            GlossaryCore.Crop: 90.,
-            GlossaryCore.Forestry: 10.,
+            GlossaryCore.Crop: np.full(year_range, 90.),
+            GlossaryCore.Forestry: np.full(year_range, 10.),
         })
 
         share_investments_inside_crop = pd.DataFrame({
             GlossaryCore.Years: years,
-            **GlossaryCore.crop_calibration_data["invest_food_type_share_start"]
+            **{food_type: np.full(year_range, share)
+               for food_type, share in GlossaryCore.crop_calibration_data["invest_food_type_share_start"].items()}
         })
 
         economics_df = pd.DataFrame({
             GlossaryCore.Years: years,
-            GlossaryCore.GrossOutput: 0.,
+            GlossaryCore.GrossOutput: np.zeros(year_range),
             GlossaryCore.OutputNetOfDamage: 1.015 ** np.arange(0,
                                                                len(years)) * DatabaseWitnessCore.MacroInitGrossOutput.get_value_at_year(
                 self.year_start) * 0.98,
@@ -102,7 +104,7 @@ class Study(StudyManager):
 
         energy_market_ratios = pd.DataFrame({
             GlossaryCore.Years: years,
-            "Total": 100.,
+            "Total": np.full(year_range, 100.),
         })
 
         inputs_dict = {
@@ -17,12 +17,22 @@ from os.path import dirname, join
 
 import numpy as np
 import pandas as pd
-from scipy.interpolate import interp1d
 from sostrades_core.study_manager.study_manager import StudyManager
 
+from climateeconomics.core.tools.usecase_dataframes import sections_df
 from climateeconomics.database import DatabaseWitnessCore
 from climateeconomics.glossarycore import GlossaryCore
 
+# energy outlook knots, interpolated over the years of the study
+ENERGY_OUTLOOK_YEARS = (2000, 2005, 2010, 2017, 2018, 2025, 2030, 2035, 2040, 2050, 2060, 2100)
+ENERGY_OUTLOOK_VALUES = (118.112, 134.122, 149.483879, 162.7848774, 166.4685636, 180.7072889, 189.6932084,
+                         197.8418842, 206.1201182, 220.000, 250.0, 300.0)
+BRUT_NET = 1 / 1.45
+# industry, services and agriculture shares of the energy supply
+SECTORS_ENERGY_SHARES = (0.2894, 0.37, 0.02136)
+# agriculture, services and industry shares of the workforce
+SECTORS_WORKFORCE_SHARES = (0.274, 0.509, 0.217)
+
 
 def update_dspace_with(dspace_dict, name, value, lower, upper):
     ''' type(value) has to be ndarray
@@ -80,66 +90,63 @@ class Study(StudyManager):
             dirname(dirname(dirname(dirname(dirname(__file__))))), 'tests', 'data')
 
         # Energy
-        brut_net = 1 / 1.45
-        energy_outlook = pd.DataFrame({
-            GlossaryCore.Years: [2000, 2005, 2010, 2017, 2018, 2025, 2030, 2035, 2040, 2050, 2060, 2100],
-            'energy': [118.112, 134.122, 149.483879, 162.7848774, 166.4685636, 180.7072889, 189.6932084,
-                       197.8418842, 206.1201182, 220.000, 250.0, 300.0]})
-        f2 = interp1d(energy_outlook[GlossaryCore.Years], energy_outlook['energy'])
         # Find values for 2020, 2050 and concat dfs
-        energy_supply = f2(np.arange(self.year_start, self.year_end + 1))
-        energy_supply_values = energy_supply * brut_net
+        energy_supply = np.interp(years, ENERGY_OUTLOOK_YEARS, ENERGY_OUTLOOK_VALUES)
+        energy_supply_values = energy_supply * BRUT_NET
+        # split between sectors in a single product
+        sectors_energy = np.outer(energy_supply_values, SECTORS_ENERGY_SHARES)
         if self.year_start == 2000 and self.year_end == 2020:
             data_dir = join(
                 dirname(dirname(dirname(dirname(dirname(dirname(__file__)))))), 'tests', 'data/sectorization_fitting')
             # Energy
             hist_energy = pd.read_csv(join(data_dir, 'hist_energy_sect.csv'))
-            services_energy = pd.DataFrame({GlossaryCore.Years: hist_energy[GlossaryCore.Years], GlossaryCore.TotalProductionValue: hist_energy[GlossaryCore.SectorServices]})
-            indus_energy = pd.DataFrame({GlossaryCore.Years: hist_energy[GlossaryCore.Years], GlossaryCore.TotalProductionValue: hist_energy[GlossaryCore.SectorIndustry]})
+            services_energy = pd.DataFrame({GlossaryCore.Years: hist_energy[GlossaryCore.Years], GlossaryCore.TotalProductionValue: hist_energy[GlossaryCore.SectorServices]}, copy=False)
+            indus_energy = pd.DataFrame({GlossaryCore.Years: hist_energy[GlossaryCore.Years], GlossaryCore.TotalProductionValue: hist_energy[GlossaryCore.SectorIndustry]}, copy=False)
             # Workforce
             hist_workforce = pd.read_csv(join(data_dir, 'hist_workforce_sect.csv'))
             workforce_df = hist_workforce
             #Tshare sectors invest
 
         else:
-            indus_energy = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.TotalProductionValue: energy_supply_values * 0.2894})
-            services_energy = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.TotalProductionValue: energy_supply_values * 0.37})
+            indus_energy = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.TotalProductionValue: sectors_energy[:, 0]}, copy=False)
+            services_energy = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.TotalProductionValue: sectors_energy[:, 1]}, copy=False)
 
-            workforce = np.ones_like(years) * 3389
+            workforce = np.full_like(years, 3389)
             workforce[0] = 3389.556200
             workforce[1] = 3450.067707
-            workforce_df = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.SectorAgriculture: workforce * 0.274,
-                                         GlossaryCore.SectorServices: workforce * 0.509, GlossaryCore.SectorIndustry: workforce * 0.217})
+            sectors_workforce = np.outer(workforce, SECTORS_WORKFORCE_SHARES)
+            workforce_df = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.SectorAgriculture: sectors_workforce[:, 0],
+                                         GlossaryCore.SectorServices: sectors_workforce[:, 1], GlossaryCore.SectorIndustry: sectors_workforce[:, 2]}, copy=False)
 
-        agri_energy = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.TotalProductionValue: energy_supply_values * 0.02136})
+        agri_energy = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.TotalProductionValue: sectors_energy[:, 2]}, copy=False)
         # Damage
         damage_df = pd.DataFrame(
             {GlossaryCore.Years: years,
-             GlossaryCore.DamageFractionOutput: np.zeros(self.nb_per),})
+             GlossaryCore.DamageFractionOutput: np.zeros(self.nb_per),}, copy=False)
 
         invest_indus = pd.DataFrame(
             {GlossaryCore.Years: years,
-             GlossaryCore.InvestmentsValue: np.linspace(40,65, len(years))*1/3})
+             GlossaryCore.InvestmentsValue: np.linspace(40,65, len(years))*1/3}, copy=False)
 
         invest_services = pd.DataFrame(
             {GlossaryCore.Years: years,
-             GlossaryCore.InvestmentsValue: np.linspace(40, 65, len(years)) * 1/6})
+             GlossaryCore.InvestmentsValue: np.linspace(40, 65, len(years)) * 1/6}, copy=False)
 
 
         invest_energy_wo_tax = pd.DataFrame(
             {GlossaryCore.Years: years,
-             GlossaryCore.EnergyInvestmentsWoTaxValue: np.linspace(40, 65, len(years))})
+             GlossaryCore.EnergyInvestmentsWoTaxValue: np.linspace(40, 65, len(years))}, copy=False)
 
 
         energy_emission_df = pd.DataFrame({
-            GlossaryCore.Years: np.arange(self.year_start, self.year_end + 1),
-            GlossaryCore.EnergyCarbonIntensityDfValue: 100.0
-        })
+            GlossaryCore.Years: years,
+            GlossaryCore.EnergyCarbonIntensityDfValue: np.full(self.nb_per, 100.0)
+        }, copy=False)
 
         energy_market_ratios = pd.DataFrame({
             GlossaryCore.Years: years,
-            "Total": 100.,
-        })
+            "Total": np.full(self.nb_per, 100.),
+        }, copy=False)
 
         sect_input = {}
         sect_input[f"{self.study_name}.{GlossaryCore.YearStart}"] = self.year_start
@@ -154,50 +161,18 @@ class Study(StudyManager):
         sect_input[f"{self.study_name}.{GlossaryCore.DamageFractionDfValue}"] = damage_df
         sect_input[f"{self.study_name}.{GlossaryCore.EnergyCarbonIntensityDfValue}"] = energy_emission_df
 
+        global_data_dir = join(dirname(dirname(dirname(dirname(dirname(dirname(__file__)))))), 'data')
         for sector in GlossaryCore.SectorsPossibleValues:
-            global_data_dir = join(dirname(dirname(dirname(dirname(dirname(dirname(__file__)))))), 'data')
-            weighted_average_percentage_per_sector_df = pd.read_csv(
-                join(global_data_dir, f'weighted_average_percentage_{sector.lower()}_sections.csv'))
-            subsector_share_dict = {
-                **{GlossaryCore.Years: np.arange(self.year_start, self.year_end + 1), },
-                **dict(zip(weighted_average_percentage_per_sector_df.columns[1:],
-                           weighted_average_percentage_per_sector_df.values[0, 1:]))
-            }
-            section_gdp_df = pd.DataFrame(subsector_share_dict)
-            sect_input[f"{self.study_name}.{self.macro_name}.{sector}.{GlossaryCore.SectionGdpPercentageDfValue}"] = section_gdp_df
-
-            section_non_energy_emission_gdp_df = pd.read_csv(
-                join(global_data_dir, f'non_energy_emission_gdp_{sector.lower()}_sections.csv'))
-            subsector_share_dict = {
-                **{GlossaryCore.Years: np.arange(self.year_start, self.year_end + 1), },
-                **dict(zip(section_non_energy_emission_gdp_df.columns[1:],
-                           section_non_energy_emission_gdp_df.values[0, 1:]))
-            }
-            section_non_energy_emission_gdp_df = pd.DataFrame(subsector_share_dict)
-            sect_input[f"{self.study_name}.{self.macro_name}.{sector}.{GlossaryCore.SectionNonEnergyEmissionGdpDfValue}"] = section_non_energy_emission_gdp_df
-
-            section_energy_consumption_percentage_df = pd.read_csv(
-                join(global_data_dir, f'energy_consumption_percentage_{sector.lower()}_sections.csv'))
-            subsector_share_dict = {
-                **{GlossaryCore.Years: np.arange(self.year_start, self.year_end + 1), },
-                **dict(zip(section_energy_consumption_percentage_df.columns[1:],
-                           section_energy_consumption_percentage_df.values[0, 1:]))
-            }
-            section_energy_consumption_percentage_df = pd.DataFrame(subsector_share_dict)
-            sect_input[
-                f"{self.study_name}.{self.macro_name}.{sector}.{GlossaryCore.SectionEnergyConsumptionPercentageDfValue}"] = section_energy_consumption_percentage_df
+            sect_input[f"{self.study_name}.{self.macro_name}.{sector}.{GlossaryCore.SectionGdpPercentageDfValue}"] = sections_df(
+                years, join(global_data_dir, f'weighted_average_percentage_{sector.lower()}_sections.csv'))
 
             # section non-energy emissions per dollar of pib
-            section_non_energy_emission_gdp_df = pd.read_csv(
-                join(global_data_dir, f'non_energy_emission_gdp_{sector.lower()}_sections.csv'))
-            section_non_energy_emission_gdp_dict = {
-                **{GlossaryCore.Years: np.arange(self.year_start, self.year_end + 1), },
-                **dict(zip(section_non_energy_emission_gdp_df.columns[1:],
-                           section_non_energy_emission_gdp_df.values[0, 1:]))
-            }
-            section_non_energy_emission_gdp_df = pd.DataFrame(section_non_energy_emission_gdp_dict)
+            sect_input[f"{self.study_name}.{self.macro_name}.{sector}.{GlossaryCore.SectionNonEnergyEmissionGdpDfValue}"] = sections_df(
+                years, join(global_data_dir, f'non_energy_emission_gdp_{sector.lower()}_sections.csv'))
+
             sect_input[
-                f"{self.study_name}.{self.macro_name}.{sector}.{GlossaryCore.SectionNonEnergyEmissionGdpDfValue}"] = section_non_energy_emission_gdp_df
+                f"{self.study_name}.{self.macro_name}.{sector}.{GlossaryCore.SectionEnergyConsumptionPercentageDfValue}"] = sections_df(
+                years, join(global_data_dir, f'energy_consumption_percentage_{sector.lower()}_sections.csv'))
 
         if self.year_start == 2000:
             sect_input[f"{self.study_name}.{self.macro_name}.{GlossaryCore.SectorIndustry}.{'capital_start'}"] = 31.763
@@ -205,48 +180,49 @@ class Study(StudyManager):
             sect_input[f"{self.study_name}.{GlossaryCore.DamageToProductivity}"] = True
 
 
-        transport_df = pd.DataFrame({GlossaryCore.Years: years, "transport": 7.6})
-        margin = pd.DataFrame({GlossaryCore.Years: years, 'margin': 110.})
+        transport_df = pd.DataFrame({GlossaryCore.Years: years, "transport": np.full(self.nb_per, 7.6)}, copy=False)
+        margin = pd.DataFrame({GlossaryCore.Years: years, 'margin': np.full(self.nb_per, 110.)}, copy=False)
 
         population_2021 = 7_954_448_391
         population_df = pd.DataFrame({
             GlossaryCore.Years: years,
             GlossaryCore.PopulationValue: np.linspace(population_2021 / 1e6, 7870 * 1.2, self.nb_per),
-        })
+        }, copy=False)
         crop_productivity_reduction = pd.DataFrame({
             GlossaryCore.Years: years,
-            GlossaryCore.CropProductivityReductionName: np.linspace(0., -4.5 * 0., len(years)) ,  # fake
-        })
+            GlossaryCore.CropProductivityReductionName: np.zeros(self.nb_per),  # fake
+        }, copy=False)
         energy_mean_price = pd.DataFrame({
             GlossaryCore.Years: years,
             GlossaryCore.EnergyPriceValue: np.linspace(70, 120, self.nb_per)
-        })
+        }, copy=False)
 
         share_investments_between_agri_subsectors = pd.DataFrame({
             GlossaryCore.Years: years,
-            GlossaryCore.Crop: 90.,
-            GlossaryCore.Forestry: 10.,
-        })
+            GlossaryCore.Crop: np.full(self.nb_per, 90.),
+            GlossaryCore.Forestry: np.full(self.nb_per, 10.),
+        }, copy=False)
 
         share_investments_inside_forestry = pd.DataFrame({
             GlossaryCore.Years: years,
-            "Managed wood": 33.,
-            "Deforestation": 33.,
-            "Reforestation": 33.,
-        })
+            "Managed wood": np.full(self.nb_per, 33.),
+            "Deforestation": np.full(self.nb_per, 33.),
+            "Reforestation": np.full(self.nb_per, 33.),
+        }, copy=False)
 
         share_investments_inside_crop = pd.DataFrame({
             GlossaryCore.Years: years,
-            **GlossaryCore.crop_calibration_data["invest_food_type_share_start"]
-        })
+            **{food_type: np.full(self.nb_per, share)
+               for food_type, share in GlossaryCore.crop_calibration_data["invest_food_type_share_start"].items()}
+        }, copy=False)
 
         economics_df = pd.DataFrame({
             GlossaryCore.Years: years,
-            GlossaryCore.GrossOutput: 0.,
+            GlossaryCore.GrossOutput: np.zeros(self.nb_per),
             GlossaryCore.OutputNetOfDamage: 1.015 ** np.arange(0,
                                                                len(years)) * DatabaseWitnessCore.MacroInitGrossOutput.get_value_at_year(
                 self.year_start) * 0.98,
-        })
+        }, copy=False)
         sect_input.update({
             f'{self.study_name}.transport_cost': transport_df,
             f'{self.study_name}.margin': margin,
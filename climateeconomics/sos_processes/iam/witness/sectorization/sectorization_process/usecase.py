@@ -17,11 +17,16 @@ from os.path import dirname, join
 
 import numpy as np
 import pandas as pd
-from scipy.interpolate import interp1d
 from sostrades_core.study_manager.study_manager import StudyManager
 
+from climateeconomics.core.tools.usecase_dataframes import sections_df
 from climateeconomics.database.database_witness_core import DatabaseWitnessCore
 from climateeconomics.glossarycore import GlossaryCore
+from climateeconomics.sos_processes.iam.witness.sectorization.economics_sector_process.usecase import (
+    BRUT_NET,
+    ENERGY_OUTLOOK_VALUES,
+    ENERGY_OUTLOOK_YEARS,
+)
 from climateeconomics.sos_processes.iam.witness.sectorization.economics_sector_process.usecase import (
     Study as StudyEconomicSectors,
 )
@@ -29,6 +34,13 @@ from climateeconomics.sos_wrapping.sos_wrapping_emissions.ghgemissions.ghgemissi
     GHGemissionsDiscipline,
 )
 
+# initialisation data: gross output (T$), workforce shares (%) and energy share of investments (%)
+INITIAL_GDP = 130.187
+WORKFORCE_SHARE_PER_SECTOR = {GlossaryCore.SectorAgriculture: 27.4,
+                              GlossaryCore.SectorIndustry: 21.7,
+                              GlossaryCore.SectorServices: 50.9}
+INVEST_ENERGY_START = 1.077
+
 
 def update_dspace_with(dspace_dict, name, value, lower, upper):
     ''' type(value) has to be ndarray
@@ -59,6 +71,26 @@ def update_dspace_dict_with(dspace_dict, name, value, lower, upper, activated_el
     dspace_dict['dspace_size'] += len(value)
 
 
+def _build_usecase_arrays(year_start, year_end):
+    ''' numerical inputs of the usecase that only depend on the years range
+    '''
+    nb_per = year_end - year_start + 1
+    # Find values for 2020, 2050 and concat dfs
+    energy_supply_values = np.interp(np.arange(year_start, year_end + 1), ENERGY_OUTLOOK_YEARS, ENERGY_OUTLOOK_VALUES) * BRUT_NET
+
+    # data for consumption
+    temperature = np.linspace(1, 3, nb_per)
+    energy_price = np.arange(110, 110 + nb_per)
+
+    # GtCO2
+    emission_forest = np.linspace(0.04, 0.04, nb_per)
+    cum_emission = np.cumsum(emission_forest)
+    # CO2, N2O and CH4 energy emissions as a single (nb_per, 3) block
+    ghg_energy_emissions = np.linspace((37., 1.7e-3, 0.17), (10., 5.e-4, 0.01), nb_per)
+
+    return energy_supply_values, temperature, energy_price, cum_emission, ghg_energy_emissions
+
+
 class Study(StudyManager):
 
     def __init__(self, year_start=GlossaryCore.YearStartDefault, year_end=GlossaryCore.YearEndDefault, name='', execution_engine=None,
@@ -81,47 +113,32 @@ class Study(StudyManager):
         self.nb_per = round(self.year_end - self.year_start + 1)
 
         # Damage
-        damage_fraction_df = pd.DataFrame(
-            {GlossaryCore.Years: years,
-             GlossaryCore.DamageFractionOutput: np.zeros(self.nb_per),
-        })
+        damage_fraction_df = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.DamageFractionOutput: np.zeros(self.nb_per)})
 
-        damage_df = pd.DataFrame(
-            {GlossaryCore.Years: years,
-             GlossaryCore.Damages: np.zeros(self.nb_per),
-             GlossaryCore.EstimatedDamages: np.zeros(self.nb_per)}
-        )
+        damage_df = pd.DataFrame({GlossaryCore.Years: years,
+                                  GlossaryCore.Damages: np.zeros(self.nb_per),
+                                  GlossaryCore.EstimatedDamages: np.zeros(self.nb_per)})
 
         # economisc df to init mda
-        gdp = [130.187] * len(years)
+        gdp = np.full(self.nb_per, INITIAL_GDP)
         economics_df = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.OutputNetOfDamage: gdp})
 
         # Investment
         invest_indus_start = DatabaseWitnessCore.InvestInduspercofgdp2020.value
         invest_agri_start = DatabaseWitnessCore.InvestAgriculturepercofgdpYearStart.value
         invest_services_start = DatabaseWitnessCore.InvestServicespercofgdpYearStart.value
-        invest_energy_start = 1.077
-        total_invest_start = invest_indus_start + invest_agri_start + invest_services_start + invest_energy_start
+        total_invest_start = invest_indus_start + invest_agri_start + invest_services_start + INVEST_ENERGY_START
 
-        total_invests = pd.DataFrame(
-            {GlossaryCore.Years: years,
-             GlossaryCore.InvestmentsValue: total_invest_start})
+        total_invests = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.InvestmentsValue: np.full(self.nb_per, total_invest_start)})
 
         # Energy
-        energy_investment_wo_tax = pd.DataFrame({GlossaryCore.Years: years,
-                                                 GlossaryCore.EnergyInvestmentsWoTaxValue: 1000.
-                                                 })
+        energy_investment_wo_tax = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.EnergyInvestmentsWoTaxValue: np.full(self.nb_per, 1000.)})
 
-        carbon_intensity_of_energy_mix = pd.DataFrame({
-            GlossaryCore.Years: np.arange(self.year_start, self.year_end + 1),
-            GlossaryCore.EnergyCarbonIntensityDfValue: 100.0
-        })
+        carbon_intensity_of_energy_mix = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.EnergyCarbonIntensityDfValue: np.full(self.nb_per, 100.0)})
 
-        share_invest_ccus = pd.DataFrame({GlossaryCore.Years: years,
-                                                    GlossaryCore.ShareInvestment: 0.01})
+        share_invest_ccus = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.ShareInvestment: np.full(self.nb_per, 0.01)})
 
-        share_invests_energy = pd.DataFrame({GlossaryCore.Years: years,
-                                                    GlossaryCore.ShareInvestment: DatabaseWitnessCore.ShareInvestEnergy.value})
+        share_invests_energy = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.ShareInvestment: np.full(self.nb_per, DatabaseWitnessCore.ShareInvestEnergy.value)})
 
         cons_input = {
             f"{self.study_name}.{GlossaryCore.YearStart}": self.year_start,
@@ -140,81 +157,41 @@ class Study(StudyManager):
 
         if self.main_study:
 
-            invest_indus = pd.DataFrame(
-                {GlossaryCore.Years: years,
-                 GlossaryCore.ShareInvestment: invest_indus_start})
+            invest_indus = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.ShareInvestment: np.full(self.nb_per, invest_indus_start)})
+
+            invest_services = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.ShareInvestment: np.full(self.nb_per, invest_services_start)})
 
-            invest_services = pd.DataFrame(
-                {GlossaryCore.Years: years,
-                 GlossaryCore.ShareInvestment: invest_services_start})
+            invest_agriculture = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.ShareInvestment: np.full(self.nb_per, invest_agri_start)})
 
-            invest_agriculture = pd.DataFrame(
-                {GlossaryCore.Years: years,
-                 GlossaryCore.ShareInvestment: invest_agri_start})
+            (energy_supply_values, temperature, energy_price, cum_emission,
+             ghg_energy_emissions) = _build_usecase_arrays(self.year_start, self.year_end)
 
             # Energy
+            energy_production = pd.DataFrame({GlossaryCore.Years: years, "Total": energy_supply_values * 0.7})
 
-            brut_net = 1 / 1.45
-            energy_outlook = pd.DataFrame({
-                GlossaryCore.Years: [2000, 2005, 2010, 2017, 2018, 2025, 2030, 2035, 2040, 2050, 2060, 2100],
-                'energy': [118.112, 134.122, 149.483879, 162.7848774, 166.4685636, 180.7072889, 189.6932084,
-                           197.8418842,
-                           206.1201182, 220.000, 250.0, 300.0]})
-            f2 = interp1d(energy_outlook[GlossaryCore.Years], energy_outlook['energy'])
-            # Find values for 2020, 2050 and concat dfs
-            energy_supply = f2(np.arange(self.year_start, self.year_end + 1))
-            energy_supply_values = energy_supply * brut_net
-
-            energy_production = pd.DataFrame(
-                {GlossaryCore.Years: years, "Total": energy_supply_values * 0.7})
-
-            energy_market_ratios = pd.DataFrame({
-                GlossaryCore.Years: years,
-                "Total": 100.,
-            })
+            energy_market_ratios = pd.DataFrame({GlossaryCore.Years: years, "Total": np.full(self.nb_per, 100.)})
 
             # data for consumption
-            temperature = np.linspace(1, 3, len(years))
             temperature_df = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.TempAtmo: temperature})
-            energy_price = np.arange(110, 110 + len(years))
-            energy_mean_price = pd.DataFrame(
-                {GlossaryCore.Years: years, GlossaryCore.EnergyPriceValue: energy_price})
+            energy_mean_price = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.EnergyPriceValue: energy_price})
 
             # workforce share
-            agrishare = 27.4
-            indusshare = 21.7
-            serviceshare = 50.9
-            workforce_share = pd.DataFrame({GlossaryCore.Years: years, GlossaryCore.SectorAgriculture: agrishare,
-                                            GlossaryCore.SectorIndustry: indusshare,
-                                            GlossaryCore.SectorServices: serviceshare})
-
-            CO2_emitted_land = pd.DataFrame()
+            workforce_share = pd.DataFrame({GlossaryCore.Years: years, **WORKFORCE_SHARE_PER_SECTOR})
+
             # GtCO2
-            emission_forest = np.linspace(0.04, 0.04, len(years))
-            cum_emission = np.cumsum(emission_forest)
-            CO2_emitted_land[GlossaryCore.Years] = years
-            CO2_emitted_land['Crop'] = np.zeros(len(years))
-            CO2_emitted_land[GlossaryCore.Forestry] = cum_emission
+            CO2_emitted_land = pd.DataFrame({GlossaryCore.Years: years,
+                                             'Crop': np.zeros(len(years)),
+                                             GlossaryCore.Forestry: cum_emission})
             GHG_total_energy_emissions = pd.DataFrame({GlossaryCore.Years: years,
-                                                       GlossaryCore.CO2: np.linspace(37., 10., len(years)),
-                                                       GlossaryCore.N2O: np.linspace(1.7e-3, 5.e-4, len(years)),
-                                                       GlossaryCore.CH4: np.linspace(0.17, 0.01, len(years))})
-            CO2_indus_emissions_df = pd.DataFrame({
-                GlossaryCore.Years: years,
-                "indus_emissions": 0.
-            })
+                                                       GlossaryCore.CO2: ghg_energy_emissions[:, 0],
+                                                       GlossaryCore.N2O: ghg_energy_emissions[:, 1],
+                                                       GlossaryCore.CH4: ghg_energy_emissions[:, 2]})
+            CO2_indus_emissions_df = pd.DataFrame({GlossaryCore.Years: years, "indus_emissions": np.zeros(self.nb_per)})
 
+            global_data_dir = join(dirname(dirname(dirname(dirname(dirname(dirname(__file__)))))), 'data')
             for sector in GlossaryCore.SectorsPossibleValues:
-                global_data_dir = join(dirname(dirname(dirname(dirname(dirname(dirname(__file__)))))), 'data')
-                section_non_energy_emission_gdp_df = pd.read_csv(
-                    join(global_data_dir, f'non_energy_emission_gdp_{sector.lower()}_sections.csv'))
-                subsector_share_dict = {
-                    **{GlossaryCore.Years: np.arange(self.year_start, self.year_end + 1), },
-                    **dict(zip(section_non_energy_emission_gdp_df.columns[1:],
-                               section_non_energy_emission_gdp_df.values[0, 1:]))
-                }
-                section_non_energy_emission_gdp_df = pd.DataFrame(subsector_share_dict)
-                cons_input[f"{self.study_name}.{GHGemissionsDiscipline.name}.{GlossaryCore.EconomicSectors}.{sector}.{GlossaryCore.SectionNonEnergyEmissionGdpDfValue}"] = section_non_energy_emission_gdp_df
+                cons_input[f"{self.study_name}.{GHGemissionsDiscipline.name}.{GlossaryCore.EconomicSectors}.{sector}.{GlossaryCore.SectionNonEnergyEmissionGdpDfValue}"] = sections_df(
+                    years, join(global_data_dir, f'non_energy_emission_gdp_{sector.lower()}_sections.csv'))
 
             cons_input.update({
                 f"{self.study_name}.{self.labormarket_name}.{'workforce_share_per_sector'}": workforce_share,
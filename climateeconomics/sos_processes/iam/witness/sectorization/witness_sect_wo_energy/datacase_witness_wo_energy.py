@@ -18,7 +18,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from numpy import arange, asarray
+from numpy import arange
 from pandas import DataFrame
 from sostrades_optimization_plugins.models.func_manager.func_manager import (
     FunctionManager,
@@ -27,6 +27,7 @@ from sostrades_optimization_plugins.models.func_manager.func_manager_disc import
     FunctionManagerDisc,
 )
 
+from climateeconomics.core.tools.usecase_dataframes import sections_df
 from climateeconomics.glossarycore import GlossaryCore
 from climateeconomics.sos_processes.iam.witness.land_use_v2_process.usecase import (
     Study as datacase_landuse,
@@ -80,7 +81,7 @@ class DataStudy():
         witness_input[f"{self.study_name}.{GlossaryCore.InitialGrossOutput['var_name']}"] = 130.187
         # Relax constraint for 15 first years
         witness_input[f"{self.study_name}.{'Damage.damage_constraint_factor'}"] = np.concatenate(
-            (np.linspace(1.0, 1.0, 20), np.asarray([1] * (len(years) - 20))))
+            (np.linspace(1.0, 1.0, 20), np.ones(len(years) - 20)))
         #         witness_input[f"{self.study_name}.{}#                      '.Damage.damage_constraint_factor'}" = np.asarray([1] * len(years))
         witness_input[f"{self.study_name}.{'InvestmentDistribution'}.reforestation_investment"] = self.reforestation_investment_df
         # get population from csv file
@@ -88,21 +89,18 @@ class DataStudy():
         global_data_dir = join(Path(__file__).parents[5], 'data')
         population_df = pd.read_csv(
             join(global_data_dir, 'population_df.csv'))
-        population_df.index = years
         witness_input[f"{self.study_name}.{'population_df'}"] = population_df
         working_age_population_df = pd.DataFrame(
-            {GlossaryCore.Years: years, GlossaryCore.Population1570: 6300}, index=years)
+            {GlossaryCore.Years: years, GlossaryCore.Population1570: np.full(nb_per, 6300)})
         witness_input[f"{self.study_name}.{GlossaryCore.WorkingAgePopulationDfValue}"] = working_age_population_df
 
         energy_investment_wo_tax = DataFrame(
             {GlossaryCore.Years: years,
-             GlossaryCore.EnergyInvestmentsWoTaxValue: asarray([1.65] * nb_per)},
-            index=years)
+             GlossaryCore.EnergyInvestmentsWoTaxValue: np.full(nb_per, 1.65)})
 
         share_non_energy_investment = DataFrame(
             {GlossaryCore.Years: years,
-             GlossaryCore.ShareNonEnergyInvestmentsValue: asarray([27. - 1.65] * nb_per)},
-            index=years)
+             GlossaryCore.ShareNonEnergyInvestmentsValue: np.full(nb_per, 27. - 1.65)})
 
         witness_input[f'{self.study_name}.{GlossaryCore.EnergyInvestmentsWoTaxValue}'] = energy_investment_wo_tax
         witness_input[f'{self.study_name}.{GlossaryCore.ShareNonEnergyInvestmentsValue}'] = share_non_energy_investment
@@ -112,22 +110,13 @@ class DataStudy():
         df_eco = DataFrame({GlossaryCore.Years: years,
                             GlossaryCore.GrossOutput: data,
                             GlossaryCore.PerCapitaConsumption: data,
-                            GlossaryCore.OutputNetOfDamage: data},
-                           index=arange(self.year_start, self.year_end + 1))
+                            GlossaryCore.OutputNetOfDamage: data})
 
         witness_input[f"{self.study_name}.{GlossaryCore.EconomicsDfValue}"] = df_eco
         for sector in GlossaryCore.SectorsPossibleValues:
-            global_data_dir = join(Path(__file__).parents[5], 'data')
-            section_non_energy_emission_gdp_df = pd.read_csv(
-                join(global_data_dir, f'non_energy_emission_gdp_{sector.lower()}_sections.csv'))
-            subsector_share_dict = {
-                **{GlossaryCore.Years: np.arange(self.year_start, self.year_end + 1), },
-                **dict(zip(section_non_energy_emission_gdp_df.columns[1:],
-                           section_non_energy_emission_gdp_df.values[0, 1:]))
-            }
-            section_non_energy_emission_gdp_df = pd.DataFrame(subsector_share_dict)
             witness_input[
-                f"{self.study_name}.GHGEmissions.{GlossaryCore.EconomicSectors}.{sector}.{GlossaryCore.SectionNonEnergyEmissionGdpDfValue}"] = section_non_energy_emission_gdp_df
+                f"{self.study_name}.GHGEmissions.{GlossaryCore.EconomicSectors}.{sector}.{GlossaryCore.SectionNonEnergyEmissionGdpDfValue}"] = sections_df(
+                years, join(global_data_dir, f'non_energy_emission_gdp_{sector.lower()}_sections.csv'))
 
         witness_input[f"{self.study_name}.{'agri_capital_techno_list'}"] = []
 
@@ -141,12 +130,12 @@ class DataStudy():
 
         witness_input[f"{self.study_name}.{GlossaryCore.insertGHGAgriLandEmissions.format(GlossaryCore.CO2)}"] = CO2_emitted_land
 
-        self.CO2_tax = np.asarray([50.] * len(years))
+        self.CO2_tax = np.full(len(years), 50.)
 
         intermediate_point = 30
         # CO2 taxes related inputs
         CO2_tax_efficiency = np.concatenate(
-            (np.linspace(30, intermediate_point, 15), np.asarray([intermediate_point] * (len(years) - 15))))
+            (np.linspace(30, intermediate_point, 15), np.full(len(years) - 15, intermediate_point)))
         # CO2_tax_efficiency = 30.0
         default_co2_efficiency = pd.DataFrame(
             {GlossaryCore.Years: years, GlossaryCore.CO2TaxEfficiencyValue: CO2_tax_efficiency})
@@ -181,13 +170,11 @@ class DataStudy():
         # setup objectives
         energy_investment_wo_tax = DataFrame(
             {GlossaryCore.Years: years,
-             GlossaryCore.EnergyInvestmentsWoTaxValue: asarray([10.] * nb_per)},
-            index=years)
+             GlossaryCore.EnergyInvestmentsWoTaxValue: np.full(nb_per, 10.)})
 
         share_non_energy_investment = DataFrame(
             {GlossaryCore.Years: years,
-             GlossaryCore.ShareNonEnergyInvestmentsValue: asarray([27. - 1.65] * nb_per)},
-            index=years)
+             GlossaryCore.ShareNonEnergyInvestmentsValue: np.full(nb_per, 27. - 1.65)})
 
         witness_input[f'{self.study_name}.{GlossaryCore.EnergyInvestmentsWoTaxValue}'] = energy_investment_wo_tax
         witness_input[f'{self.study_name}.{GlossaryCore.ShareNonEnergyInvestmentsValue}'] = share_non_energy_investment
@@ -211,7 +198,7 @@ class DataStudy():
         witness_input[f'{self.study_name}.{GlossaryCore.GHGEnergyEmissionsDfValue}'] = GHG_total_energy_emissions
 
         ccs_price = pd.DataFrame({GlossaryCore.Years: years,
-                                  "ccs_price_per_tCO2": 500.,})
+                                  "ccs_price_per_tCO2": np.full(nb_per, 500.),})
 
         witness_input[f'{self.study_name}.CCS_price'] = ccs_price
         setup_data_list.update(witness_input)
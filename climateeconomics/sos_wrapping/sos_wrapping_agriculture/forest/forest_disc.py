@@ -14,6 +14,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 '''
+import numpy as np
 from energy_models.core.stream_type.energy_models.biomass_dry import BiomassDry
 from sostrades_core.tools.post_processing.charts.chart_filter import ChartFilter
 from sostrades_core.tools.post_processing.charts.two_axes_instanciated_chart import (
@@ -31,6 +32,10 @@ from climateeconomics.sos_wrapping.sos_wrapping_sectors.subsector_discipline imp
     SubSectorDiscipline,
 )
 
+# output variable names shared by DESC_OUT and the post-processing, formatted once
+FORESTRY_PRODUCTION_DF = f"{GlossaryCore.Forestry}.{GlossaryCore.ProductionDfValue}"
+FORESTRY_DAMAGE_DF = f"{GlossaryCore.Forestry}.{GlossaryCore.DamageDfValue}"
+
 
 class ForestryDiscipline(SubSectorDiscipline):
     """Forestry discipline"""
@@ -128,10 +133,6 @@ class ForestryDiscipline(SubSectorDiscipline):
                         'CO2_from_production': - 0.425 * 44.01 / 12.0,
                         'CO2_from_production_unit': 'kg/kg'}
 
-    # invest: 0.19 Mha are planted each year at 13047.328euro/ha, and 28% is
-    # the share of wood (not residue)
-    invest_before_year_start = DatabaseWitnessCore.get_reforestation_invest_before_year_start(year_start=GlossaryCore.YearStartDefault, construction_delay=construction_delay)[0]
-
     # protected forest are 21% of total forest
     # https://research.wri.org/gfr/forest-designation-indicators/protected-forests
     # FAO states 18% of total forest, namely 0.7GHa (https://www.fao.org/state-of-forests/en/)
@@ -150,8 +151,7 @@ class ForestryDiscipline(SubSectorDiscipline):
         'managed_wood_initial_surface': {'type': 'float', 'unit': 'Gha', 'default': wood_production_surface,},
         'managed_wood_invest_before_year_start': {'type': 'dataframe', 'unit': 'G$',
                                              'dataframe_descriptor': {GlossaryCore.InvestmentsValue: ('float', [0, 1e9], True)},
-                                             'dataframe_edition_locked': False,
-                                             'default': invest_before_year_start,},
+                                             'dataframe_edition_locked': False,},
         'transport_cost': {'type': 'dataframe', 'unit': '$/t', 'namespace': GlossaryCore.NS_WITNESS,
                                 'visibility': ClimateEcoDiscipline.SHARED_VISIBILITY,
                                 'dataframe_descriptor': {GlossaryCore.Years: ('float', None, False),
@@ -204,8 +204,8 @@ class ForestryDiscipline(SubSectorDiscipline):
         'forestry_lost_capital': {
             'type': 'dataframe', 'unit': 'G$', 'visibility': ClimateEcoDiscipline.SHARED_VISIBILITY, 'namespace': GlossaryCore.NS_AGRI},
         'yields': {'type': 'dataframe', 'unit': 'm^3/Ha', 'description': 'evolution of yields. Yields are affected by temperature change'},
-        f"{GlossaryCore.Forestry}.{GlossaryCore.ProductionDfValue}": subsector_production_df,
-        f"{GlossaryCore.Forestry}.{GlossaryCore.DamageDfValue}": GlossaryCore.get_subsector_damage_df(subsector_name=GlossaryCore.Forestry, sector_namespace=GlossaryCore.NS_AGRI),
+        FORESTRY_PRODUCTION_DF: subsector_production_df,
+        FORESTRY_DAMAGE_DF: GlossaryCore.get_subsector_damage_df(subsector_name=GlossaryCore.Forestry, sector_namespace=GlossaryCore.NS_AGRI),
         GlossaryCore.DamageDetailedDfValue: {'type': 'dataframe', 'unit': 'G$', 'description': 'Economical damages details.'},
         GlossaryCore.EconomicsDetailDfValue: {'type': 'dataframe', 'unit': 'G$', 'description': 'Net economical output details.'},
         "Forestry." + GlossaryCore.ProdForStreamName.format('biomass_dry'): GlossaryCore.get_subsector_variable(var_descr=GlossaryCore.ProdForStreamVar, sector_namespace=GlossaryCore.NS_AGRI, subsector_name=GlossaryCore.Forestry),
@@ -219,8 +219,18 @@ class ForestryDiscipline(SubSectorDiscipline):
         self.update_default_values()
         return {}, {}
 
+    @classmethod
+    def get_default_invest_before_year_start(cls):
+        """
+        invest: 0.19 Mha are planted each year at 13047.328euro/ha, and 28% is the share of wood (not residue)
+        read from the database at configure time instead of at import
+        """
+        return DatabaseWitnessCore.get_reforestation_invest_before_year_start(year_start=GlossaryCore.YearStartDefault, construction_delay=cls.construction_delay)[0]
+
     def update_default_values(self):
         disc_in = self.get_data_in()
+        if disc_in is not None and 'managed_wood_invest_before_year_start' in disc_in:
+            self.update_default_value('managed_wood_invest_before_year_start', 'in', self.get_default_invest_before_year_start())
         if disc_in is not None and GlossaryCore.YearStart in disc_in:
             year_start = self.get_sosdisc_inputs(GlossaryCore.YearStart)
             if year_start is not None:
@@ -265,45 +275,58 @@ class ForestryDiscipline(SubSectorDiscipline):
                 if chart_filter.filter_key == 'charts':
                     chart_list = chart_filter.selected_values
 
-        forest_surface_df = self.get_sosdisc_outputs('forest_surface_detail_df')
-        managed_wood_df = self.get_sosdisc_outputs('managed_wood_df')
-        years = managed_wood_df[GlossaryCore.Years]
+        if not chart_list:
+            return instanciated_charts
+
+        outputs = {}
+
+        def get_output(name):
+            # outputs shared by several charts are fetched once from the data manager
+            if name not in outputs:
+                outputs[name] = self.get_sosdisc_outputs(name)
+            return outputs[name]
+
+        years = get_output('managed_wood_df')[GlossaryCore.Years].tolist()
+
+        def bar(values, name):
+            return InstanciatedSeries(years, values, name, InstanciatedSeries.BAR_DISPLAY)
+
+        def line(values, name):
+            return InstanciatedSeries(years, values, name, InstanciatedSeries.LINES_DISPLAY)
+
         if "Economical output" in chart_list:
-            economical_output_df = self.get_sosdisc_outputs(f"{GlossaryCore.Forestry}.{GlossaryCore.ProductionDfValue}")
-            economical_damages_df = self.get_sosdisc_outputs(f"{GlossaryCore.Forestry}.{GlossaryCore.DamageDfValue}")
+            economical_output_df = get_output(FORESTRY_PRODUCTION_DF)
+            economical_damages_df = get_output(FORESTRY_DAMAGE_DF)
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, GlossaryCore.SubsectorProductionDf['unit'], chart_name='Economical output of forestry', stacked_bar=True)
 
-            for col in economical_output_df.columns:
-                if col != GlossaryCore.Years:
-                    new_chart.add_series(InstanciatedSeries(years, economical_output_df[col], self.pimp_string(col), "lines"))
+            for col in economical_output_df.columns.drop(GlossaryCore.Years):
+                new_chart.add_series(line(economical_output_df[col], self.pimp_string(col)))
 
-            new_chart.add_series(InstanciatedSeries(years, -economical_damages_df[GlossaryCore.Damages], "Damages", "bar"))
+            new_chart.add_series(bar(-economical_damages_df[GlossaryCore.Damages], "Damages"))
             new_chart.post_processing_section_name = "Economical output"
             instanciated_charts.append(new_chart)
 
         if "Economical output" in chart_list:
             economical_detail = self.get_sosdisc_outputs(GlossaryCore.EconomicsDetailDfValue)
-            economical_output_df = self.get_sosdisc_outputs(f"{GlossaryCore.Forestry}.{GlossaryCore.ProductionDfValue}")
+            economical_output_df = get_output(FORESTRY_PRODUCTION_DF)
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, GlossaryCore.SubsectorProductionDf['unit'], chart_name='Net economical output breakdown', stacked_bar=True)
 
-            for col in economical_detail.columns:
-                if col != GlossaryCore.Years:
-                    new_chart.add_series(InstanciatedSeries(years, economical_detail[col], self.pimp_string(col), "bar"))
+            for col in economical_detail.columns.drop(GlossaryCore.Years):
+                new_chart.add_series(bar(economical_detail[col], self.pimp_string(col)))
 
-            new_chart.add_series(InstanciatedSeries(years, economical_output_df[GlossaryCore.OutputNetOfDamage], "Total", "lines"))
+            new_chart.add_series(line(economical_output_df[GlossaryCore.OutputNetOfDamage], "Total"))
             new_chart.post_processing_section_name = "Economical output"
             instanciated_charts.append(new_chart)
 
         if "Damages" in chart_list:
-            economical_damages_df = self.get_sosdisc_outputs(f"{GlossaryCore.Forestry}.{GlossaryCore.DamageDfValue}")
+            economical_damages_df = get_output(FORESTRY_DAMAGE_DF)
             economical_damages_df_detailed = self.get_sosdisc_outputs(GlossaryCore.DamageDetailedDfValue)
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, GlossaryCore.SubsectorDamagesDf['unit'], chart_name='Economical damages', stacked_bar=True)
 
-            for col in economical_damages_df_detailed.columns:
-                if col != GlossaryCore.Years:
-                    new_chart.add_series(InstanciatedSeries(years, economical_damages_df_detailed[col], self.pimp_string(col), "bar"))
+            for col in economical_damages_df_detailed.columns.drop(GlossaryCore.Years):
+                new_chart.add_series(bar(economical_damages_df_detailed[col], self.pimp_string(col)))
 
-            new_chart.add_series(InstanciatedSeries(years, economical_damages_df[GlossaryCore.Damages], "Total", "lines"))
+            new_chart.add_series(line(economical_damages_df[GlossaryCore.Damages], "Total"))
             new_chart.post_processing_section_name = "Damages"
             instanciated_charts.append(new_chart)
 
@@ -311,9 +334,8 @@ class ForestryDiscipline(SubSectorDiscipline):
             yields_df = self.get_sosdisc_outputs('yields')
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'm^3/Ha', chart_name='Yields')
 
-            for col in yields_df.columns:
-                if col != GlossaryCore.Years:
-                    new_chart.add_series(InstanciatedSeries(years, yields_df[col], self.pimp_string(col), "lines"))
+            for col in yields_df.columns.drop(GlossaryCore.Years):
+                new_chart.add_series(line(yields_df[col], self.pimp_string(col)))
 
             new_chart.post_processing_section_name = "Damages"
             instanciated_charts.append(new_chart)
@@ -322,9 +344,8 @@ class ForestryDiscipline(SubSectorDiscipline):
             crop_productivity_reduction = self.get_sosdisc_inputs(GlossaryCore.CropProductivityReductionName)
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, GlossaryCore.CropProductivityReductionDf['unit'], chart_name='Yields variation due to climate change')
 
-            for col in crop_productivity_reduction.columns:
-                if col != GlossaryCore.Years:
-                    new_chart.add_series(InstanciatedSeries(years, crop_productivity_reduction[col], self.pimp_string(col), "lines"))
+            for col in crop_productivity_reduction.columns.drop(GlossaryCore.Years):
+                new_chart.add_series(line(crop_productivity_reduction[col], self.pimp_string(col)))
 
             new_chart.post_processing_section_name = "Damages"
             instanciated_charts.append(new_chart)
@@ -334,21 +355,14 @@ class ForestryDiscipline(SubSectorDiscipline):
             instanciated_charts.append(new_chart)
 
         if "Surface" in chart_list:
-            # values are *1000 to convert from Gha to Mha
-            delta_reforestation = forest_surface_df['delta_reforestation_surface'].values * 1e3
-            reforestation = forest_surface_df['reforestation_surface'].values * 1e3
-
-            delta_deforestation = forest_surface_df['delta_deforestation_surface'].values * 1e3
-            deforestation = forest_surface_df['deforestation_surface'].values * 1e3
-
-            delta_managed_wood_surface = managed_wood_df['delta_surface'].values * 1e3
-            managed_wood_surface = managed_wood_df['cumulative_surface'].values * 1e3
-
-            delta_global = forest_surface_df['delta_global_forest_surface'].values * 1e3
-            global_surface = forest_surface_df['global_forest_surface'].values * 1e3
-
-            unmanaged_forest = forest_surface_df['unmanaged_forest'].values * 1e3
-            protected_forest = forest_surface_df['protected_forest_surface'].values * 1e3
+            forest_surface_df = self.get_sosdisc_outputs('forest_surface_detail_df')
+            managed_wood_df = get_output('managed_wood_df')
+            # values are *1000 to convert from Gha to Mha, each frame being scaled as a single block
+            (delta_reforestation, reforestation, delta_deforestation, deforestation,
+             delta_global, global_surface, unmanaged_forest, protected_forest) = forest_surface_df[
+                ['delta_reforestation_surface', 'reforestation_surface', 'delta_deforestation_surface', 'deforestation_surface',
+                 'delta_global_forest_surface', 'global_forest_surface', 'unmanaged_forest', 'protected_forest_surface']].to_numpy().T * 1e3
+            delta_managed_wood_surface, managed_wood_surface = managed_wood_df[['delta_surface', 'cumulative_surface']].to_numpy().T * 1e3
 
             # forest evolution year by year chart
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years,
@@ -356,10 +370,13 @@ class ForestryDiscipline(SubSectorDiscipline):
                                                  chart_name='Yearly delta of forest surface evolution',
                                                  stacked_bar=True)
 
-            new_chart.add_series(InstanciatedSeries(years, delta_deforestation.tolist(), 'Deforestation', 'bar'))
-            new_chart.add_series(InstanciatedSeries(years, delta_managed_wood_surface.tolist(), 'Managed wood', 'bar'))
-            new_chart.add_series(InstanciatedSeries(years, delta_global.tolist(), 'Global forest surface', InstanciatedSeries.LINES_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, delta_reforestation.tolist(), 'Reforestation', 'bar'))
+            for series, values, name in (
+                (bar, delta_deforestation, 'Deforestation'),
+                (bar, delta_managed_wood_surface, 'Managed wood'),
+                (line, delta_global, 'Global forest surface'),
+                (bar, delta_reforestation, 'Reforestation'),
+            ):
+                new_chart.add_series(series(values, name))
 
             new_chart.post_processing_section_name = "Surface"
             instanciated_charts.append(new_chart)
@@ -368,36 +385,35 @@ class ForestryDiscipline(SubSectorDiscipline):
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'Forest surface evolution [Mha]',
                                                  chart_name='Global forest surface evolution', stacked_bar=True)
 
-            new_chart.add_series(InstanciatedSeries(years, deforestation.tolist(), 'Deforested surface', 'bar'))
-            new_chart.add_series(InstanciatedSeries(years, reforestation.tolist(), 'Reforested surface', 'bar'))
-            new_chart.add_series(InstanciatedSeries(years, global_surface.tolist(), 'Forest surface evolution', InstanciatedSeries.LINES_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, managed_wood_surface.tolist(), 'Managed wood', 'bar'))
-            new_chart.add_series(InstanciatedSeries(years, unmanaged_forest.tolist(), 'Unmanaged forest', 'bar'))
-            new_chart.add_series(InstanciatedSeries(years, protected_forest.tolist(), 'Protected forest', 'bar'))
+            for series, values, name in (
+                (bar, deforestation, 'Deforested surface'),
+                (bar, reforestation, 'Reforested surface'),
+                (line, global_surface, 'Forest surface evolution'),
+                (bar, managed_wood_surface, 'Managed wood'),
+                (bar, unmanaged_forest, 'Unmanaged forest'),
+                (bar, protected_forest, 'Protected forest'),
+            ):
+                new_chart.add_series(series(values, name))
 
             new_chart.post_processing_section_name = "Surface"
             instanciated_charts.append(new_chart)
 
         if "Emissions" in chart_list:
-
             CO2_emissions_df = self.get_sosdisc_outputs(GlossaryCore.CO2EmissionsDetailDfValue)
-            delta_reforestation = CO2_emissions_df['delta_CO2_reforestation'].values
-            reforestation = CO2_emissions_df['CO2_reforestation'].values
-
-            delta_deforestation = CO2_emissions_df['delta_CO2_deforestation'].values
-            deforestation = CO2_emissions_df['CO2_deforestation'].values
-
-            init_balance = CO2_emissions_df['initial_CO2_land_use_change'].values
-
-            delta_global = CO2_emissions_df['delta_CO2_emitted'].values
-            global_surface = CO2_emissions_df['emitted_CO2_evol_cumulative'].values
+            (co2_delta_reforestation, co2_reforestation, co2_delta_deforestation, co2_deforestation,
+             co2_initial_balance, co2_delta_global, co2_global) = CO2_emissions_df[
+                ['delta_CO2_reforestation', 'CO2_reforestation', 'delta_CO2_deforestation', 'CO2_deforestation',
+                 'initial_CO2_land_use_change', 'delta_CO2_emitted', 'emitted_CO2_evol_cumulative']].to_numpy().T
 
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'CO2 emission & capture [GtCO2 / year]',
                                                  chart_name='Yearly forest delta CO2 emissions', stacked_bar=True)
 
-            new_chart.add_series(InstanciatedSeries(years, delta_deforestation.tolist(), 'Deforestation emissions', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, delta_reforestation.tolist(), 'Reforestation emissions', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, delta_global.tolist(), 'Global CO2 balance', InstanciatedSeries.LINES_DISPLAY))
+            for series, values, name in (
+                (bar, co2_delta_deforestation, 'Deforestation emissions'),
+                (bar, co2_delta_reforestation, 'Reforestation emissions'),
+                (line, co2_delta_global, 'Global CO2 balance'),
+            ):
+                new_chart.add_series(series(values, name))
 
             new_chart.post_processing_section_name = "Emissions"
             instanciated_charts.append(new_chart)
@@ -405,31 +421,42 @@ class ForestryDiscipline(SubSectorDiscipline):
             # in Gt
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'CO2 emission & capture [GtCO2]',
                                                  chart_name='Forestry CO2 emissions', stacked_bar=True)
-            new_chart.add_series(InstanciatedSeries(years, deforestation.tolist(), 'Deforestation emissions', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, reforestation.tolist(), 'Reforestation emissions', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, global_surface.tolist(), 'Global CO2 balance', InstanciatedSeries.LINES_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, init_balance.tolist(), 'initial forest emissions', InstanciatedSeries.BAR_DISPLAY))
+            for series, values, name in (
+                (bar, co2_deforestation, 'Deforestation emissions'),
+                (bar, co2_reforestation, 'Reforestation emissions'),
+                (line, co2_global, 'Global CO2 balance'),
+                (bar, co2_initial_balance, 'initial forest emissions'),
+            ):
+                new_chart.add_series(series(values, name))
 
             new_chart.post_processing_section_name = "Emissions"
             instanciated_charts.append(new_chart)
 
         if "Biomass and energy production" in chart_list:
             # biomass chart
-            biomass_dry_df = self.get_sosdisc_outputs('biomass_dry_detail_df')
+            managed_wood_df = get_output('managed_wood_df')
+            biomass_dry_df = get_output('biomass_dry_detail_df')
+            # managed wood productions used by the three charts below, extracted once
+            managed_wood_productions = {col: managed_wood_df[col].to_numpy() for col in (
+                'residues_production_for_energy (Mt)', 'wood_production_for_energy (Mt)',
+                'residues_production_for_industry (Mt)', 'wood_production_for_industry (Mt)')}
 
             # chart biomass dry for energy production
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'Biomass dry [Mt]',
                                                  chart_name='Break down of biomass dry production for energy',
                                                  stacked_bar=True)
-            mw_residues_energy = managed_wood_df['residues_production_for_energy (Mt)']
-            mw_wood_energy = managed_wood_df['wood_production_for_energy (Mt)']
-            biomass_dry_energy = biomass_dry_df['biomass_dry_for_energy (Mt)']
-            deforestation_energy = biomass_dry_df['deforestation_for_energy']
-
-            new_chart.add_series(InstanciatedSeries(years, mw_residues_energy.tolist(), 'Residues from managed wood', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, mw_wood_energy.tolist(), 'Wood from managed wood', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, deforestation_energy.tolist(), 'Biomass from deforestation', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, biomass_dry_energy.tolist(), 'Total biomass dry produced', InstanciatedSeries.LINES_DISPLAY))
+            mw_residues_energy = managed_wood_productions['residues_production_for_energy (Mt)']
+            mw_wood_energy = managed_wood_productions['wood_production_for_energy (Mt)']
+            biomass_dry_energy = biomass_dry_df['biomass_dry_for_energy (Mt)'].to_numpy()
+            deforestation_energy = biomass_dry_df['deforestation_for_energy'].to_numpy()
+
+            for series, values, name in (
+                (bar, mw_residues_energy, 'Residues from managed wood'),
+                (bar, mw_wood_energy, 'Wood from managed wood'),
+                (bar, deforestation_energy, 'Biomass from deforestation'),
+                (line, biomass_dry_energy, 'Total biomass dry produced'),
+            ):
+                new_chart.add_series(series(values, name))
 
             new_chart.post_processing_section_name = "Biomass and energy production"
             instanciated_charts.append(new_chart)
@@ -438,16 +465,17 @@ class ForestryDiscipline(SubSectorDiscipline):
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'Biomass dry [TWh]',
                                                  chart_name='Break down of biomass dry production for energy',
                                                  stacked_bar=True)
-            mw_residues_energy_twh = managed_wood_df[
-                                         'residues_production_for_energy (Mt)'] * ForestryDiscipline.biomass_cal_val
-            mw_wood_energy_twh = managed_wood_df['wood_production_for_energy (Mt)'] * ForestryDiscipline.biomass_cal_val
-            biomass_dry_energy_twh = biomass_dry_df['biomass_dry_for_energy (Mt)'] * ForestryDiscipline.biomass_cal_val
-            deforestation_energy_twh = biomass_dry_df['deforestation_for_energy'] * ForestryDiscipline.biomass_cal_val
-
-            new_chart.add_series(InstanciatedSeries(years, mw_residues_energy_twh.tolist(), 'Residues from managed wood', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, mw_wood_energy_twh.tolist(), 'Wood from managed wood', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, deforestation_energy_twh.tolist(), 'Biomass from deforestation', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, biomass_dry_energy_twh.tolist(), 'Total biomass dry produced', InstanciatedSeries.LINES_DISPLAY))
+            # Mt to TWh in a single multiply of the stacked productions
+            mw_residues_energy_twh, mw_wood_energy_twh, biomass_dry_energy_twh, deforestation_energy_twh = \
+                np.stack([mw_residues_energy, mw_wood_energy, biomass_dry_energy, deforestation_energy]) * ForestryDiscipline.biomass_cal_val
+
+            for series, values, name in (
+                (bar, mw_residues_energy_twh, 'Residues from managed wood'),
+                (bar, mw_wood_energy_twh, 'Wood from managed wood'),
+                (bar, deforestation_energy_twh, 'Biomass from deforestation'),
+                (line, biomass_dry_energy_twh, 'Total biomass dry produced'),
+            ):
+                new_chart.add_series(series(values, name))
 
             new_chart.post_processing_section_name = "Biomass and energy production"
             instanciated_charts.append(new_chart)
@@ -455,33 +483,36 @@ class ForestryDiscipline(SubSectorDiscipline):
             # chart total biomass dry production
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'Biomass dry [Mt]',
                                                  chart_name='Break down of biomass dry production', stacked_bar=True)
-            residues_industry = managed_wood_df[
-                'residues_production_for_industry (Mt)'].values
-            wood_industry = managed_wood_df['wood_production_for_industry (Mt)'].values
-            deforestation_industry = biomass_dry_df['deforestation_for_industry']
+            residues_industry = managed_wood_productions['residues_production_for_industry (Mt)']
+            wood_industry = managed_wood_productions['wood_production_for_industry (Mt)']
+            deforestation_industry = biomass_dry_df['deforestation_for_industry'].to_numpy()
             biomass_industry = residues_industry + wood_industry + deforestation_industry
-            residues_energy = mw_residues_energy
-            wood_energy = mw_wood_energy
-            biomass_energy = residues_energy + wood_energy + deforestation_energy
+            biomass_energy = mw_residues_energy + mw_wood_energy + deforestation_energy
 
-            new_chart.add_series(InstanciatedSeries(years, biomass_industry.tolist(), 'Biomass dedicated to industry', InstanciatedSeries.BAR_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, biomass_energy.tolist(), 'Biomass dedicated to energy', InstanciatedSeries.BAR_DISPLAY))
+            for series, values, name in (
+                (bar, biomass_industry, 'Biomass dedicated to industry'),
+                (bar, biomass_energy, 'Biomass dedicated to energy'),
+            ):
+                new_chart.add_series(series(values, name))
 
             new_chart.post_processing_section_name = "Biomass and energy production"
             instanciated_charts.append(new_chart)
 
         if "Biomass price" in chart_list:
             # biomassdry price per kWh
+            biomass_dry_df = get_output('biomass_dry_detail_df')
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'Price [$/MWh]',
                                                  chart_name='Biomass dry price evolution', stacked_bar=True)
-            biomass_dry_df = self.get_sosdisc_outputs('biomass_dry_detail_df')
-            mw_price = biomass_dry_df['managed_wood_price_per_MWh']
-            deforestation_price = biomass_dry_df['deforestation_price_per_MWh']
-            average_price = biomass_dry_df['price_per_MWh']
+            mw_price = biomass_dry_df['managed_wood_price_per_MWh'].to_numpy()
+            deforestation_price = biomass_dry_df['deforestation_price_per_MWh'].to_numpy()
+            average_price = biomass_dry_df['price_per_MWh'].to_numpy()
 
-            new_chart.add_series(InstanciatedSeries(years, mw_price.tolist(), 'Managed wood', InstanciatedSeries.LINES_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, average_price.tolist(), 'Biomass dry', InstanciatedSeries.LINES_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, deforestation_price.tolist(), 'Deforestation', InstanciatedSeries.LINES_DISPLAY))
+            for series, values, name in (
+                (line, mw_price, 'Managed wood'),
+                (line, average_price, 'Biomass dry'),
+                (line, deforestation_price, 'Deforestation'),
+            ):
+                new_chart.add_series(series(values, name))
 
             new_chart.post_processing_section_name = "Biomass price"
             instanciated_charts.append(new_chart)
@@ -489,13 +520,16 @@ class ForestryDiscipline(SubSectorDiscipline):
             # biomass dry price per ton
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'Price [$/ton]',
                                                  chart_name='Biomass dry price evolution', stacked_bar=True)
-            mw_price = biomass_dry_df['managed_wood_price_per_ton']
-            deforestation_price = biomass_dry_df['deforestation_price_per_ton']
-            average_price = biomass_dry_df['price_per_ton']
+            mw_price = biomass_dry_df['managed_wood_price_per_ton'].to_numpy()
+            deforestation_price = biomass_dry_df['deforestation_price_per_ton'].to_numpy()
+            average_price = biomass_dry_df['price_per_ton'].to_numpy()
 
-            new_chart.add_series(InstanciatedSeries(years, mw_price.tolist(), 'Managed wood', InstanciatedSeries.LINES_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, average_price.tolist(), 'Biomass dry', InstanciatedSeries.LINES_DISPLAY))
-            new_chart.add_series(InstanciatedSeries(years, deforestation_price.tolist(), 'Deforestation', InstanciatedSeries.LINES_DISPLAY))
+            for series, values, name in (
+                (line, mw_price, 'Managed wood'),
+                (line, average_price, 'Biomass dry'),
+                (line, deforestation_price, 'Deforestation'),
+            ):
+                new_chart.add_series(series(values, name))
 
             new_chart.post_processing_section_name = "Biomass price"
             instanciated_charts.append(new_chart)
@@ -506,7 +540,7 @@ class ForestryDiscipline(SubSectorDiscipline):
             new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'Lost capital [G$]',
                                                  chart_name='Lost capital due to deforestation', stacked_bar=True)
 
-            new_chart.add_series(InstanciatedSeries(years, lost_capital_df['deforestation'], 'Deforestation Lost Capital', 'bar'))
+            new_chart.add_series(bar(lost_capital_df['deforestation'], 'Deforestation Lost Capital'))
             new_chart.post_processing_section_name = "Investments and capital"
             instanciated_charts.append(new_chart)
 
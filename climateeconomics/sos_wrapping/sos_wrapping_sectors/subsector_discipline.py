@@ -13,7 +13,6 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 '''
-import copy
 
 import numpy as np
 import pandas as pd
@@ -47,7 +46,7 @@ class SubSectorDiscipline(AutodifferentiedDisc):
                 # then we compute invest in subs sector as sub-sector-invest = Net outpput * Share invest sector * Share invest sub sector * Shares invests inside Sub sector
 
                 # requires net output
-                economics_df = copy.deepcopy(GlossaryCore.EconomicsDf)
+                economics_df = GlossaryCore.get_dynamic_variable(GlossaryCore.EconomicsDf)
                 del economics_df["dataframe_descriptor"][GlossaryCore.PerCapitaConsumption]
                 dynamic_inputs[GlossaryCore.EconomicsDfValue] = economics_df
 
@@ -95,9 +94,8 @@ class SubSectorDiscipline(AutodifferentiedDisc):
         total_subsector_invest_df = self.get_sosdisc_outputs(f"{self.sector_name}.{self.subsector_name}.{GlossaryCore.InvestmentDfValue}")
         new_chart = TwoAxesInstanciatedChart(GlossaryCore.Years, 'Investments [G$]', chart_name=f'Investments in {self.subsector_name}', stacked_bar=True)
         years = sub_sector_invest_details_df[GlossaryCore.Years]
-        for col in sub_sector_invest_details_df.columns:
-            if col != GlossaryCore.Years:
-                new_chart.add_series(InstanciatedSeries(years, sub_sector_invest_details_df[col], col, 'bar'))
+        for col in sub_sector_invest_details_df.columns.drop(GlossaryCore.Years):
+            new_chart.add_series(InstanciatedSeries(years, sub_sector_invest_details_df[col], col, 'bar'))
 
         new_chart.add_series(InstanciatedSeries(years, total_subsector_invest_df[GlossaryCore.InvestmentsValue], 'Total', 'lines'))
 